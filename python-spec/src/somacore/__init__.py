@@ -2,47 +2,137 @@
 
 Types will be defined in their own modules and then imported here for a single
 unified namespace.
+
+Members of that namespace are loaded lazily (via a :pep:`562` module-level
+``__getattr__``), so importing ``somacore`` does not import every submodule
+and its dependencies until they are first used.
 """
 
 # __init__ files, used strictly for re-exporting, are the exception to the
 # "import modules only" style used in somacore.
 
-from typing import Tuple, Union
+import importlib
+import os
+from typing import TYPE_CHECKING, Any, List, Tuple, Union
 
 # TODO: pyarrow >= 14.0.1 doesn't play well with some other PyPI packages
 # on Mac OS: https://github.com/apache/arrow/issues/42154
 # Remove this once we can pin to recent pyarrow.
 import pyarrow_hotfix  # noqa: F401
 
-from .base import SOMAObject
-from .collection import Collection
-from .coordinates import AffineTransform
-from .coordinates import Axis
-from .coordinates import CoordinateSpace
-from .coordinates import CoordinateTransform
-from .coordinates import IdentityTransform
-from .coordinates import ScaleTransform
-from .coordinates import UniformScaleTransform
-from .data import DataFrame
-from .data import DenseNDArray
-from .data import NDArray
-from .data import ReadIter
-from .data import SparseNDArray
-from .data import SparseRead
-from .experiment import Experiment
-from .measurement import Measurement
-from .options import BatchSize
-from .options import IOfN
-from .options import ResultOrder
-from .query import AxisColumnNames
-from .query import AxisQuery
-from .query import ExperimentAxisQuery
-from .scene import Scene
-from .spatial import GeometryDataFrame
-from .spatial import MultiscaleImage
-from .spatial import PointCloudDataFrame
-from .spatial import SpatialRead
-from .types import ContextBase
+if TYPE_CHECKING:
+    # Keep these in sync with _LAZY below.
+    from .base import SOMAObject
+    from .collection import Collection
+    from .coordinates import AffineTransform
+    from .coordinates import Axis
+    from .coordinates import CoordinateSpace
+    from .coordinates import CoordinateTransform
+    from .coordinates import IdentityTransform
+    from .coordinates import ScaleTransform
+    from .coordinates import UniformScaleTransform
+    from .data import DataFrame
+    from .data import DenseNDArray
+    from .data import NDArray
+    from .data import ReadIter
+    from .data import RecordBatchReadIter
+    from .data import SparseNDArray
+    from .data import SparseRead
+    from .experiment import Experiment
+    from .measurement import Measurement
+    from .options import BatchSize
+    from .options import IOfN
+    from .options import ResultOrder
+    from .query import AxisColumnNames
+    from .query import AxisQuery
+    from .query import ExperimentAxisQuery
+    from .scene import Scene
+    from .spatial import GeometryDataFrame
+    from .spatial import MultiscaleImage
+    from .spatial import PointCloudDataFrame
+    from .spatial import SpatialRead
+    from .types import ContextBase
+
+_LAZY = {
+    "SOMAObject": "base",
+    "Collection": "collection",
+    "AffineTransform": "coordinates",
+    "Axis": "coordinates",
+    "CoordinateSpace": "coordinates",
+    "CoordinateTransform": "coordinates",
+    "IdentityTransform": "coordinates",
+    "ScaleTransform": "coordinates",
+    "UniformScaleTransform": "coordinates",
+    "DataFrame": "data",
+    "DenseNDArray": "data",
+    "NDArray": "data",
+    "ReadIter": "data",
+    "RecordBatchReadIter": "data",
+    "SparseNDArray": "data",
+    "SparseRead": "data",
+    "Experiment": "experiment",
+    "Measurement": "measurement",
+    "BatchSize": "options",
+    "IOfN": "options",
+    "ResultOrder": "options",
+    "AxisColumnNames": "query",
+    "AxisQuery": "query",
+    "ExperimentAxisQuery": "query",
+    "Scene": "scene",
+    "GeometryDataFrame": "spatial",
+    "MultiscaleImage": "spatial",
+    "PointCloudDataFrame": "spatial",
+    "SpatialRead": "spatial",
+    "ContextBase": "types",
+}
+"""The name of the submodule that defines each lazily-loaded member."""
+
+_SUBMODULES = frozenset(
+    (
+        "base",
+        "collection",
+        "coordinates",
+        "data",
+        "experiment",
+        "measurement",
+        "options",
+        "query",
+        "scene",
+        "spatial",
+        "types",
+    )
+)
+"""Submodules that are imported on first access as ``somacore.<name>``."""
+
+
+# Type checkers see the names through the imports above instead. Hiding the
+# module-level __getattr__ keeps them reporting unknown attributes as errors.
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name in _SUBMODULES:
+            return importlib.import_module(f".{name}", __name__)
+        try:
+            module_name = _LAZY[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+        # Cache the value so that later lookups bypass this function entirely.
+        globals()[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(globals()) | _LAZY.keys() | _SUBMODULES)
+
+    if os.environ.get("SOMA_EAGER_IMPORT", "").lower() in ("1", "true"):
+        # Resolve everything up front so that a broken import surfaces here
+        # (e.g., in CI) rather than at some later first use.
+        for _name in _LAZY:
+            __getattr__(_name)
+        del _name
+
 
 try:
     # This trips up mypy since it's a generated file:
@@ -62,13 +152,13 @@ __all__ = (
     "DenseNDArray",
     "NDArray",
     "ReadIter",
+    "RecordBatchReadIter",
     "SparseNDArray",
     "SparseRead",
     "SpatialRead",
     "Experiment",
     "Measurement",
     "Scene",
-    "ImageProperties",
     "MultiscaleImage",
     "GeometryDataFrame",
     "PointCloudDataFrame",
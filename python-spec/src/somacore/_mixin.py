@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Generic, MutableMapping, Type, TypeVar, Union, overload
 
-import attrs
-
 from . import base
 
 _ST = TypeVar("_ST", bound=base.SOMAObject)
@@ -13,7 +12,6 @@ _Coll = MutableMapping[str, _ST]
 _T = TypeVar("_T")
 
 
-@attrs.define()
 class item(Generic[_T]):
     """Descriptor to transform property access into indexing.
 
@@ -37,23 +35,45 @@ class item(Generic[_T]):
         inst.second = 500
     """
 
-    typ: Type[_T] | None = None
+    __slots__ = ("typ", "item_name", "field_name", "_missing_msg")
+
+    typ: Type[_T] | None
     """The type we expect to return from this field."""
 
-    item_name: str | None = None
+    item_name: str | None
     """The name of the item we are getting (``x._backing["whatever"]``).
 
     This uses the name of the field by default but can be manually overridden.
     """
 
-    field_name: str = attrs.field(default="<unknown>", init=False)
+    field_name: str
     """The name of this field (``x.whatever``). Set automatically."""
 
+    def __init__(self, typ: Type[_T] | None = None, item_name: str | None = None):
+        self.typ = typ
+        # Item names are looked up in the collection on every access; interning
+        # them lets dict probes short-circuit on identity.
+        self.item_name = None if item_name is None else sys.intern(item_name)
+        self.field_name = "<unknown>"
+        self._missing_msg = self._missing_suffix()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(typ={self.typ!r}, item_name={self.item_name!r},"
+            f" field_name={self.field_name!r})"
+        )
+
+    def _missing_suffix(self) -> str:
+        return f" object has no attribute {self.field_name!r}"
+
     def __set_name__(self, owner: Type[_Coll], name: str) -> None:
         del owner  # unused
         self.field_name = name
         if self.item_name is None:
-            self.item_name = name
+            self.item_name = sys.intern(name)
+        # Failed reads are common (every ``hasattr`` probe for an absent item
+        # ends up here), so only the type name is formatted per failure.
+        self._missing_msg = self._missing_suffix()
 
     @overload
     def __get__(self, inst: None, owner: Type[_Coll]) -> "item[_T]": ...
@@ -62,17 +82,16 @@ class item(Generic[_T]):
     def __get__(self, inst: _Coll, owner: Type[_Coll]) -> _T: ...
 
     def __get__(self, inst: _Coll | None, owner: Type[_Coll]) -> Union["item", _T]:
-        del owner  # unused
-        if not inst:
+        # This is on the path of every attribute read, so we avoid anything
+        # extra here: a truthiness test would call the collection's __len__.
+        if inst is None:
             return self
         assert self.item_name is not None
         try:
             # TODO: Type-check params/returns?
             return inst[self.item_name]
         except KeyError as ke:
-            raise AttributeError(
-                f"{_typename(inst)!r} object has no attribute {self.field_name!r}"
-            ) from ke
+            raise AttributeError(repr(type(inst).__name__) + self._missing_msg) from ke
 
     def __set__(self, inst: _Coll, value: _T) -> None:
         assert self.item_name is not None
@@ -82,7 +101,7 @@ class item(Generic[_T]):
             inst[self.item_name] = value
         except KeyError as ke:
             raise AttributeError(
-                f"{_typename(inst)!r} does not support assigning"
+                f"{type(inst).__name__!r} does not support assigning"
                 f" to item {self.item_name!r}"
             ) from ke
 
@@ -92,9 +111,5 @@ class item(Generic[_T]):
             del inst[self.item_name]
         except KeyError as ke:
             raise AttributeError(
-                f"{_typename(inst)} does not support deleting {self.item_name!r}"
+                f"{type(inst).__name__} does not support deleting {self.item_name!r}"
             ) from ke
-
-
-def _typename(x: object) -> str:
-    return type(x).__name__
@@ -148,7 +148,11 @@ class SOMAObject(metaclass=abc.ABCMeta):
 
     def __del__(self) -> None:
         self.close()
-        super_del = getattr(super(), "__del__", lambda: None)
+        # Cooperatively call any __del__ later in the MRO; object has none.
+        try:
+            super_del = super().__del__  # type: ignore[misc]
+        except AttributeError:
+            return
         super_del()
 
     # Explicitly use Python's identity-based equality/hash checks.
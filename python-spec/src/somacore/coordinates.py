@@ -5,7 +5,7 @@ from __future__ import annotations
 import abc
 import collections.abc
 import itertools
-from typing import Iterable, Sequence, Tuple, Union
+from typing import Iterable, Iterator, Sequence, Tuple, Union
 
 import attrs
 import numpy as np
@@ -29,8 +29,15 @@ class Axis:
     """Optional string name for the units of the axis."""
 
 
+class _AxisNamesSlot(collections.abc.Sequence[Axis]):
+    """Holds the axis name cache of a CoordinateSpace outside its attrs fields."""
+
+    __slots__ = ("_axis_names",)
+    _axis_names: Tuple[str, ...]
+
+
 @attrs.define(frozen=True)
-class CoordinateSpace(collections.abc.Sequence[Axis]):
+class CoordinateSpace(_AxisNamesSlot):
     """A coordinate space for spatial data.
 
     Args:
@@ -49,7 +56,7 @@ class CoordinateSpace(collections.abc.Sequence[Axis]):
     def _validate(self, _, axes: Tuple[Axis, ...]) -> None:
         if not axes:
             raise ValueError("The coordinate space must have at least one axis.")
-        if len(set(axis.name for axis in self.axes)) != len(axes):
+        if len(set(axis.name for axis in axes)) != len(axes):
             raise ValueError("The names for the axes must be unique.")
 
     def __len__(self) -> int:
@@ -58,13 +65,30 @@ class CoordinateSpace(collections.abc.Sequence[Axis]):
     def __getitem__(self, index: int) -> Axis:  # type: ignore[override]
         return self.axes[index]
 
+    # The Sequence mixins would index one axis at a time through __getitem__;
+    # delegate to the tuple instead.
+
+    def __iter__(self) -> Iterator[Axis]:
+        return iter(self.axes)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.axes
+
     @property
     def axis_names(self) -> Tuple[str, ...]:
         """The names of the axes in order.
 
         Lifecycle: experimental
         """
-        return tuple(axis.name for axis in self.axes)
+        # The axes never change, so their names are computed once. The cache is
+        # not an attrs field (so asdict() and evolve() see only the axes), which
+        # also means it is not carried over by pickling; fill it on first use.
+        try:
+            return self._axis_names
+        except AttributeError:
+            names = tuple(axis.name for axis in self.axes)
+            object.__setattr__(self, "_axis_names", names)
+            return names
 
 
 class CoordinateTransform(metaclass=abc.ABCMeta):
@@ -79,6 +103,8 @@ class CoordinateTransform(metaclass=abc.ABCMeta):
     Lifecycle: experimental
     """
 
+    __slots__ = ("_input_axes", "_output_axes", "__weakref__")
+
     def __init__(
         self,
         input_axes: Union[str, Sequence[str]],
@@ -166,6 +192,8 @@ class AffineTransform(CoordinateTransform):
     Lifecycle: experimental
     """
 
+    __slots__ = ("_matrix",)
+
     def __init__(
         self,
         input_axes: Union[str, Sequence[str]],
@@ -182,36 +210,48 @@ class AffineTransform(CoordinateTransform):
             )
         rank = len(self.input_axes)
 
-        # Create and validate the augmented matrix.
-        self._matrix: npt.NDArray[np.float64] = np.array(matrix, dtype=np.float64)
-        if self._matrix.shape == (rank + 1, rank + 1):
-            if not (
-                self._matrix[-1, -1] == 1.0
-                and np.array_equal(self._matrix[-1, :-1], np.zeros((rank,)))
-            ):
+        # Create and validate the augmented matrix. These are typically 3x3 or
+        # 4x4, where NumPy's per-call overhead outweighs the arithmetic. The
+        # input is converted (and copied) once, and a full augmented matrix is
+        # then kept as-is rather than copied again.
+        input_matrix = np.array(matrix, dtype=np.float64)
+        self._matrix: npt.NDArray[np.float64]
+        if input_matrix.shape == (rank + 1, rank + 1):
+            if not (input_matrix[-1, -1] == 1.0 and not input_matrix[-1, :-1].any()):
                 raise ValueError(
-                    f"Input matrix {self._matrix} has augmented matrix shape, but is not a valid "
+                    f"Input matrix {input_matrix} has augmented matrix shape, but is not a valid "
                     f"augmented matrix."
                 )
-        elif self._matrix.shape == (rank, rank + 1):
-            self._matrix = np.vstack(
-                (
-                    self._matrix,
-                    np.hstack((np.zeros((rank,)), np.array([1]))),
-                )
-            )
-        elif self._matrix.shape == (rank, rank):
-            self._matrix = np.vstack(
-                (
-                    np.hstack((self._matrix, np.zeros((rank, 1)))),
-                    np.hstack((np.zeros((rank,)), np.array([1]))),
-                )
-            )
+            self._matrix = input_matrix
+        elif input_matrix.shape in ((rank, rank + 1), (rank, rank)):
+            # Fill in the missing bottom row (and, if needed, the zero translation).
+            self._matrix = np.zeros((rank + 1, rank + 1))
+            self._matrix[:rank, : input_matrix.shape[1]] = input_matrix
+            self._matrix[rank, rank] = 1.0
         else:
             raise ValueError(
-                f"Unexpected shape {self._matrix.shape} for the input affine matrix."
+                f"Unexpected shape {input_matrix.shape} for the input affine matrix."
             )
 
+    @staticmethod
+    def _unchecked(
+        input_axes: Tuple[str, ...],
+        output_axes: Tuple[str, ...],
+        matrix: npt.NDArray[np.float64],
+    ) -> "AffineTransform":
+        """Creates an AffineTransform without validating its arguments.
+
+        This is for results derived from existing transforms, whose axes and
+        augmented matrix are already known to be valid. ``matrix`` must be a
+        new array; it is used as-is rather than copied. The result is always a
+        plain AffineTransform, since subclasses carry additional state.
+        """
+        transform = object.__new__(AffineTransform)
+        transform._input_axes = input_axes
+        transform._output_axes = output_axes
+        transform._matrix = matrix
+        return transform
+
     def _contents_lines(self) -> Iterable[str]:
         yield "  augmented matrix:"
         yield "    " + str(self._matrix).replace("\n", "\n    ")
@@ -223,12 +263,23 @@ class AffineTransform(CoordinateTransform):
             )
         self._check_matmul_inner_axes(other)
         if isinstance(other, IdentityTransform):
-            return AffineTransform(other.input_axes, self.output_axes, self._matrix)
+            return AffineTransform._unchecked(
+                other.input_axes, self.output_axes, self._matrix.copy()
+            )
+        if isinstance(other, ScaleTransform):
+            # Multiplying by a diagonal matrix on the right scales our columns.
+            matrix = self._matrix.copy()
+            matrix[:, :-1] *= other.scale_factors
+            return AffineTransform._unchecked(
+                other.input_axes, self.output_axes, matrix
+            )
         if isinstance(other, AffineTransform):
-            return AffineTransform(
+            return AffineTransform._unchecked(
                 other.input_axes,
                 self.output_axes,
-                self.augmented_matrix @ other.augmented_matrix,
+                # np.dot skips matmul's ufunc dispatch, which dominates for the
+                # small matrices used here.
+                np.dot(self._matrix, other._matrix),
             )
         raise NotImplementedError(
             f"Cannot multiply a CoordinateTransform by type {type(other)!r}."
@@ -248,15 +299,40 @@ class AffineTransform(CoordinateTransform):
         Lifecycle: experimental
         """
         rank = len(self.output_axes)
-        inv_a = np.linalg.inv(self._matrix[:-1, :-1])
-        b2 = -inv_a @ self._matrix[:-1, -1].reshape((rank, 1))
-        inv_augmented: npt.NDArray[np.float64] = np.vstack(
-            (
-                np.hstack((inv_a, b2)),
-                np.hstack((np.zeros(rank), np.array([1]))),
-            )
+        if rank == 2:
+            inv_augmented = _inverse_augmented_2d(self._matrix)
+        else:
+            # The inverse of [[A, b], [0, 1]] is [[inv(A), -inv(A) @ b], [0, 1]].
+            inv_a = np.linalg.inv(self._matrix[:rank, :rank])
+            inv_augmented = np.zeros((rank + 1, rank + 1))
+            inv_augmented[:rank, :rank] = inv_a
+            inv_augmented[:rank, rank] = -(inv_a @ self._matrix[:rank, rank])
+            inv_augmented[rank, rank] = 1.0
+        return AffineTransform._unchecked(
+            self.output_axes, self.input_axes, inv_augmented
         )
-        return AffineTransform(self.output_axes, self.input_axes, inv_augmented)
+
+
+def _inverse_augmented_2d(
+    matrix: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Inverts the 3x3 augmented matrix of a 2D affine transform.
+
+    2D is the common case for spatial data. At this size LAPACK's call overhead
+    dominates, so the closed-form inverse is several times faster.
+    """
+    (a, b, tx), (c, d, ty) = matrix[:2].tolist()
+    det = a * d - b * c
+    if det == 0.0:
+        raise np.linalg.LinAlgError("Singular matrix")
+    inv_a, inv_b, inv_c, inv_d = d / det, -b / det, -c / det, a / det
+    return np.array(
+        [
+            [inv_a, inv_b, -(inv_a * tx + inv_b * ty)],
+            [inv_c, inv_d, -(inv_c * tx + inv_d * ty)],
+            [0.0, 0.0, 1.0],
+        ]
+    )
 
 
 class ScaleTransform(AffineTransform):
@@ -271,6 +347,8 @@ class ScaleTransform(AffineTransform):
     Lifecycle: experimental
     """
 
+    __slots__ = ("_scale_factors",)
+
     def __init__(
         self,
         input_axes: Union[str, Sequence[str]],
@@ -290,6 +368,29 @@ class ScaleTransform(AffineTransform):
 
         super().__init__(input_axes, output_axes, np.diag(self._scale_factors))
 
+    @staticmethod
+    def _from_scale_factors(
+        input_axes: Tuple[str, ...],
+        output_axes: Tuple[str, ...],
+        scale_factors: npt.NDArray[np.float64],
+    ) -> "ScaleTransform":
+        """Creates a ScaleTransform without validating its arguments.
+
+        Like :meth:`AffineTransform._unchecked`, this is for results derived
+        from existing transforms. ``scale_factors`` must be a new array with one
+        value per axis; it is used as-is rather than copied.
+        """
+        rank = len(scale_factors)
+        matrix = np.identity(rank + 1)
+        # Every (rank + 2)th element of the flattened matrix is on the diagonal.
+        matrix.flat[: -1 : rank + 2] = scale_factors
+        transform = object.__new__(ScaleTransform)
+        transform._input_axes = input_axes
+        transform._output_axes = output_axes
+        transform._scale_factors = scale_factors
+        transform._matrix = matrix
+        return transform
+
     def _contents_lines(self) -> Iterable[str]:
         yield f"  scales: {self._scale_factors}"
 
@@ -300,10 +401,18 @@ class ScaleTransform(AffineTransform):
             )
         self._check_matmul_inner_axes(other)
         if isinstance(other, ScaleTransform):
-            return ScaleTransform(
+            return ScaleTransform._from_scale_factors(
                 other.input_axes,
                 self.output_axes,
-                self.scale_factors * other.scale_factors,
+                self._scale_factors * other._scale_factors,
+            )
+        if isinstance(other, AffineTransform):
+            # Multiplying by a diagonal matrix on the left scales the rows of
+            # the other's matrix.
+            matrix = other._matrix.copy()
+            matrix[:-1] *= self._scale_factors[:, np.newaxis]
+            return AffineTransform._unchecked(
+                other.input_axes, self.output_axes, matrix
             )
         return super().__matmul__(other)
 
@@ -312,7 +421,7 @@ class ScaleTransform(AffineTransform):
 
         Lifecycle: experimental
         """
-        return ScaleTransform(
+        return ScaleTransform._from_scale_factors(
             self.output_axes, self.input_axes, 1.0 / self._scale_factors
         )
 
@@ -336,6 +445,8 @@ class UniformScaleTransform(ScaleTransform):
     Lifecycle: experimental
     """
 
+    __slots__ = ("_scale",)
+
     def __init__(
         self,
         input_axes: Union[str, Sequence[str]],
@@ -391,6 +502,8 @@ class IdentityTransform(UniformScaleTransform):
     Lifecycle: experimental
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         input_axes: Union[str, Sequence[str]],
@@ -410,6 +523,12 @@ class IdentityTransform(UniformScaleTransform):
         if isinstance(other, IdentityTransform):
             self._check_matmul_inner_axes(other)
             return IdentityTransform(other.input_axes, self.output_axes)
+        if isinstance(other, AffineTransform) and not isinstance(other, ScaleTransform):
+            # Composing with the identity only relabels the output axes.
+            self._check_matmul_inner_axes(other)
+            return AffineTransform._unchecked(
+                other.input_axes, self.output_axes, other._matrix.copy()
+            )
         return super().__matmul__(other)
 
     def inverse_transform(self) -> "IdentityTransform":
@@ -12,8 +12,10 @@ import abc
 from typing import (
     Any,
     ClassVar,
+    Dict,
     Iterator,
     List,
+    Mapping,
     Sequence,
     Tuple,
     TypeVar,
@@ -115,7 +117,7 @@ class DataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         coords: options.SparseDFCoords = (),
         column_names: Sequence[str] | None = None,
         *,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         value_filter: str | None = None,
@@ -175,6 +177,75 @@ class DataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    def read_batches(
+        self,
+        coords: options.SparseDFCoords = (),
+        column_names: Sequence[str] | None = None,
+        *,
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
+        partitions: options.ReadPartitions | None = None,
+        result_order: options.ResultOrderStr = _RO_AUTO,
+        value_filter: str | None = None,
+        platform_config: options.PlatformConfig | None = None,
+    ) -> "ReadIter[pa.RecordBatch]":
+        """Reads a user-defined slice of data into Arrow record batches.
+
+        This accepts the same arguments and returns the same data as
+        :meth:`read`, but yields each batch as a :class:`pa.RecordBatch` rather
+        than wrapping it in a :class:`pa.Table`. Callers that process data one
+        batch at a time can use this to avoid building a table per batch.
+        Calling ``concat()`` on the result returns all remaining data as a
+        single record batch.
+
+        Implementations that do not support batch-level reads may raise
+        ``NotImplementedError``; users should then fall back to :meth:`read`.
+
+        Returns:
+            A :class:`ReadIter` of :class:`pa.RecordBatch`es.
+
+        Lifecycle: experimental
+        """
+        raise NotImplementedError()
+
+    def read_columns(
+        self,
+        coords: options.SparseDFCoords = (),
+        column_names: Sequence[str] | None = None,
+        *,
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
+        partitions: options.ReadPartitions | None = None,
+        result_order: options.ResultOrderStr = _RO_AUTO,
+        value_filter: str | None = None,
+        platform_config: options.PlatformConfig | None = None,
+    ) -> "ReadIter[Mapping[str, pa.Array]]":
+        """Reads a user-defined slice of data into one Arrow array per column.
+
+        This accepts the same arguments and returns the same data as
+        :meth:`read`, but yields each batch as a mapping from column name to
+        a single contiguous :class:`pa.Array`. Code that works on individual
+        columns (e.g., converting them to NumPy) can use this directly
+        without going through a table and its chunked arrays.
+
+        The default implementation is built on :meth:`read_batches`.
+
+        Returns:
+            A :class:`ReadIter` of mappings from column name to
+            :class:`pa.Array`.
+
+        Lifecycle: experimental
+        """
+        return _ColumnsReadIter(
+            self.read_batches(
+                coords,
+                column_names,
+                batch_size=batch_size,
+                partitions=partitions,
+                result_order=result_order,
+                value_filter=value_filter,
+                platform_config=platform_config,
+            )
+        )
+
     @abc.abstractmethod
     def change_domain(
         self,
@@ -244,6 +315,9 @@ class DataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
     def schema(self) -> pa.Schema:
         """The schema of the data in this dataframe.
 
+        This does not change while the dataframe is open, so implementations
+        may read it once when opening rather than on every access.
+
         Lifecycle: maturing
         """
         raise NotImplementedError()
@@ -253,6 +327,8 @@ class DataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
     def index_column_names(self) -> Tuple[str, ...]:
         """The names of the index (dimension) columns.
 
+        Like :attr:`schema`, this is fixed while the dataframe is open.
+
         Lifecycle: maturing
         """
         raise NotImplementedError()
@@ -341,6 +417,11 @@ class NDArray(base.SOMAObject, metaclass=abc.ABCMeta):
     def ndim(self) -> int:
         """The number of dimensions in this array.
 
+        This is fixed when the array is created (:meth:`resize` may change the
+        length of each dimension, but never their number). Implementations
+        where :attr:`shape` is expensive to look up may override this to
+        return a value cached when the array is opened.
+
         Lifecycle: maturing
         """
         return len(self.shape)
@@ -350,6 +431,9 @@ class NDArray(base.SOMAObject, metaclass=abc.ABCMeta):
     def schema(self) -> pa.Schema:
         """The schema of the data in this array.
 
+        This does not change while the array is open, so implementations
+        may read it once when opening rather than on every access.
+
         Lifecycle: maturing
         """
         raise NotImplementedError()
@@ -476,7 +560,7 @@ class SparseNDArray(NDArray, metaclass=abc.ABCMeta):
         self,
         coords: options.SparseNDCoords = (),
         *,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         platform_config: options.PlatformConfig | None = None,
@@ -584,6 +668,11 @@ _T = TypeVar("_T")
 class ReadIter(Iterator[_T], metaclass=abc.ABCMeta):
     """SparseRead result iterator allowing users to flatten the iteration.
 
+    Results are streamed: each call to ``next`` reads only the next batch, so
+    users can process data larger than memory one batch at a time.
+    Implementations must not read the entire result up front (e.g., into a
+    list); only :meth:`concat` brings all remaining data into memory at once.
+
     Lifecycle: maturing
     """
 
@@ -604,6 +693,62 @@ class ReadIter(Iterator[_T], metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
 
+class RecordBatchReadIter(ReadIter[pa.RecordBatch]):
+    """A :class:`ReadIter` over the batches of an Arrow record batch stream.
+
+    SOMA implementations whose storage engine produces a
+    :class:`pa.RecordBatchReader` can wrap it in this type to return it from
+    methods like :meth:`SparseRead.record_batches`. Each step of iteration is
+    a single call to the reader's ``read_next_batch``, and :meth:`concat` reads
+    and merges the rest of the stream in Arrow.
+
+    Lifecycle: experimental
+    """
+
+    __slots__ = ("_reader",)
+
+    def __init__(self, reader: pa.RecordBatchReader) -> None:
+        self._reader = reader
+
+    def __next__(self) -> pa.RecordBatch:
+        # Raises StopIteration once the stream is exhausted.
+        return self._reader.read_next_batch()
+
+    def concat(self) -> pa.RecordBatch:
+        table = self._reader.read_all().combine_chunks()
+        batches = table.to_batches()
+        if not batches:
+            return pa.RecordBatch.from_pylist([], schema=table.schema)
+        if len(batches) > 1:
+            # combine_chunks keeps a column in several chunks when merging them
+            # would overflow its 32-bit offsets (e.g., over 2 GiB of strings),
+            # and no single record batch can hold such a column.
+            raise ValueError(
+                "The remaining data is too large to combine into a single"
+                " record batch; iterate over the batches instead."
+            )
+        return batches[0]
+
+
+class _ColumnsReadIter(ReadIter[Mapping[str, pa.Array]]):
+    """Adapts a ReadIter of record batches to yield a mapping of columns."""
+
+    __slots__ = ("_batches",)
+
+    def __init__(self, batches: ReadIter[pa.RecordBatch]) -> None:
+        self._batches = batches
+
+    def __next__(self) -> Mapping[str, pa.Array]:
+        return _batch_columns(next(self._batches))
+
+    def concat(self) -> Mapping[str, pa.Array]:
+        return _batch_columns(self._batches.concat())
+
+
+def _batch_columns(batch: pa.RecordBatch) -> Dict[str, pa.Array]:
+    return dict(zip(batch.schema.names, batch.columns))
+
+
 class SparseRead:
     """Intermediate type to choose result format when reading a sparse array.
 
@@ -618,6 +763,15 @@ class SparseRead:
     __slots__ = ()
 
     def coos(self) -> ReadIter[pa.SparseCOOTensor]:
+        """Returns the data as an iterator of sparse COO tensors.
+
+        Implementations should read coordinates (as ``int64``) and values
+        directly into contiguous buffers of their final type, and build each
+        tensor with :meth:`pa.SparseCOOTensor.from_numpy`, which wraps those
+        buffers without copying them again.
+
+        Lifecycle: maturing
+        """
         raise NotImplementedError()
 
     def dense_tensors(self) -> ReadIter[pa.Tensor]:
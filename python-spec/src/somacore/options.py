@@ -6,10 +6,10 @@ SOMA types that require them, not reimplemented by the implementing package.
 
 from __future__ import annotations
 
+import dataclasses
 import enum
-from typing import Any, Dict, Mapping, Sequence, TypeVar, Union
+from typing import Any, Dict, Mapping, Sequence, Tuple, TypeVar, Union
 
-import attrs
 import numpy as np
 import numpy.typing as npt
 import pyarrow as pa
@@ -39,8 +39,23 @@ class ReadPartitions:
     __slots__ = ()
 
 
-@attrs.define(frozen=True)
-class IOfN(ReadPartitions):
+class _FrozenSlots:
+    """Base for small immutable value types whose fields live in ``__slots__``.
+
+    Subclasses set their fields in ``__init__`` with ``object.__setattr__`` and
+    define ``__eq__``, ``__hash__``, ``__repr__``, and ``__reduce__`` over them.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+class IOfN(ReadPartitions, _FrozenSlots):
     """Specifies that a read should return partition ``i`` out of ``n`` total.
 
     For a read operation that returns ``n`` partitions, the read operation will
@@ -51,22 +66,36 @@ class IOfN(ReadPartitions):
         Experimental
     """
 
-    i: int = attrs.field()
+    __slots__ = ("i", "n")
+
+    i: int
     """Which partition to return (zero-indexed)."""
-    n: int = attrs.field()
+    n: int
     """How many partitions there will be."""
 
-    @i.validator
-    def _validate(self, _, __):
-        del _, __  # Unused.
-        if not 0 <= self.i < self.n:
-            raise ValueError(
-                f"Partition index {self.i} must be in the range [0, {self.n})"
-            )
+    def __init__(self, i: int, n: int) -> None:
+        if not 0 <= i < n:
+            raise ValueError(f"Partition index {i} must be in the range [0, {n})")
+        object.__setattr__(self, "i", i)
+        object.__setattr__(self, "n", n)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.i, self.n) == (other.i, other.n)
+
+    def __hash__(self) -> int:
+        return hash((self.i, self.n))
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(i={self.i!r}, n={self.n!r})"
 
-@attrs.define(frozen=True)
-class BatchSize:
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default slots-based pickling would go through our __setattr__.
+        return type(self), (self.i, self.n)
+
+
+class BatchSize(_FrozenSlots):
     """Specifies the size of a batch that should be returned from reads.
 
     Read operations on foundational types return an iterator over "batches" of
@@ -91,20 +120,48 @@ class BatchSize:
         Experimental
     """
 
-    count: int | None = attrs.field(default=None)
+    __slots__ = ("count", "bytes")
+
+    count: int | None
     """``arrow.Table``s with this number of rows will be returned."""
-    bytes: int | None = attrs.field(default=None)
+    bytes: int | None
     """Data of up to this size in bytes will be returned."""
 
-    @count.validator
-    @bytes.validator
-    def _validate(self, attr: attrs.Attribute, value):
-        if not value:
-            return  # None (or 0, which we treat equivalently) is always valid.
-        if value < 0:
-            raise ValueError(f"If set, '{attr.name}' must be positive")
-        if self.count and self.bytes:
-            raise ValueError("Either 'count' or 'bytes' may be set, not both")
+    def __init__(self, count: int | None = None, bytes: int | None = None) -> None:
+        # None (or 0, which we treat equivalently) is always valid, so the
+        # common automatically-sized case only needs this one check.
+        if count or bytes:
+            if count and bytes:
+                raise ValueError("Either 'count' or 'bytes' may be set, not both")
+            if count and count < 0:
+                raise ValueError("If set, 'count' must be positive")
+            if bytes and bytes < 0:
+                raise ValueError("If set, 'bytes' must be positive")
+        object.__setattr__(self, "count", count)
+        object.__setattr__(self, "bytes", bytes)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.count, self.bytes) == (other.count, other.bytes)
+
+    def __hash__(self) -> int:
+        return hash((self.count, self.bytes))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count!r}, bytes={self.bytes!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default slots-based pickling would go through our __setattr__.
+        return type(self), (self.count, self.bytes)
+
+
+DEFAULT_BATCH_SIZE: Final = BatchSize()
+"""The default, automatically-sized :class:`BatchSize` used by read operations.
+
+Since ``BatchSize`` is immutable, this single instance is shared as the default
+value for every ``batch_size`` parameter rather than constructing a new one.
+"""
 
 
 PlatformConfig = Union[Dict[str, Mapping[str, Any]], object]
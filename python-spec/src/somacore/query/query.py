@@ -20,6 +20,7 @@ from .. import ReadIter
 from .. import SparseRead
 from .. import measurement
 from .. import types as base_types
+from ..options import DEFAULT_BATCH_SIZE
 from ..options import BatchSize
 from ..options import PlatformConfig
 from ..options import ReadPartitions
@@ -61,7 +62,7 @@ class ExperimentAxisQuery(ABC):
         self,
         *,
         column_names: Sequence[str] | None = None,
-        batch_size: BatchSize = BatchSize(),
+        batch_size: BatchSize = DEFAULT_BATCH_SIZE,
         partitions: ReadPartitions | None = None,
         result_order: ResultOrderStr = _RO_AUTO,
         platform_config: PlatformConfig | None = None,
@@ -79,7 +80,7 @@ class ExperimentAxisQuery(ABC):
         self,
         *,
         column_names: Sequence[str] | None = None,
-        batch_size: BatchSize = BatchSize(),
+        batch_size: BatchSize = DEFAULT_BATCH_SIZE,
         partitions: ReadPartitions | None = None,
         result_order: ResultOrderStr = _RO_AUTO,
         platform_config: PlatformConfig | None = None,
@@ -140,7 +141,7 @@ class ExperimentAxisQuery(ABC):
         self,
         layer_name: str,
         *,
-        batch_size: BatchSize = BatchSize(),
+        batch_size: BatchSize = DEFAULT_BATCH_SIZE,
         partitions: ReadPartitions | None = None,
         result_order: ResultOrderStr = _RO_AUTO,
         platform_config: PlatformConfig | None = None,
@@ -117,7 +117,7 @@ class PointCloudDataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         coords: options.SparseDFCoords = (),
         column_names: Sequence[str] | None = None,
         *,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         value_filter: str | None = None,
@@ -157,7 +157,7 @@ class PointCloudDataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         *,
         region_transform: coordinates.CoordinateTransform | None = None,
         region_coord_space: coordinates.CoordinateSpace | None = None,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         value_filter: str | None = None,
@@ -352,7 +352,7 @@ class GeometryDataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         coords: options.SparseDFCoords = (),
         column_names: Sequence[str] | None = None,
         *,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         value_filter: str | None = None,
@@ -392,7 +392,7 @@ class GeometryDataFrame(base.SOMAObject, metaclass=abc.ABCMeta):
         *,
         region_transform: coordinates.CoordinateTransform | None = None,
         region_coord_space: coordinates.CoordinateSpace | None = None,
-        batch_size: options.BatchSize = options.BatchSize(),
+        batch_size: options.BatchSize = options.DEFAULT_BATCH_SIZE,
         partitions: options.ReadPartitions | None = None,
         result_order: options.ResultOrderStr = _RO_AUTO,
         value_filter: str | None = None,
@@ -0,0 +1,51 @@
+from typing import Any, List
+
+from somacore import base
+
+
+class _Object(base.SOMAObject):
+    __slots__ = ("calls",)
+
+    def __init__(self, calls: List[str]) -> None:
+        self.calls = calls
+
+    @classmethod
+    def open(cls, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError()
+
+    @classmethod
+    def exists(cls, *args: Any, **kwargs: Any) -> bool:
+        raise NotImplementedError()
+
+    uri = "file:///test"
+    metadata: Any = {}
+    mode = "r"
+    closed = False
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+
+class _Finalizing:
+    __slots__ = ()
+
+    def __del__(self) -> None:
+        self.calls.append("later __del__")  # type: ignore[attr-defined]
+
+
+class _Cooperative(_Object, _Finalizing):
+    __slots__ = ()
+
+
+def test_del_closes():
+    calls: List[str] = []
+    obj = _Object(calls)
+    del obj
+    assert calls == ["close"]
+
+
+def test_del_calls_later_del():
+    calls: List[str] = []
+    obj = _Cooperative(calls)
+    del obj
+    assert calls == ["close", "later __del__"]
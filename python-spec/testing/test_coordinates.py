@@ -1,3 +1,6 @@
+import pickle
+
+import attrs
 import numpy as np
 import pytest
 
@@ -23,6 +26,7 @@ def check_transform_is_equal(
     elif isinstance(desired, ScaleTransform):
         assert isinstance(actual, ScaleTransform)
         np.testing.assert_array_equal(actual.scale_factors, desired.scale_factors)
+        np.testing.assert_array_equal(actual.augmented_matrix, desired.augmented_matrix)
     elif isinstance(desired, AffineTransform):
         assert isinstance(actual, AffineTransform)
         np.testing.assert_array_equal(actual.augmented_matrix, desired.augmented_matrix)
@@ -37,6 +41,12 @@ def test_coordinate_space():
     assert len(coord_space) == 2
     assert coord_space.axis_names == ("x", "y")
     assert coord_space[0] == Axis("x", unit="nanometer")
+    assert list(coord_space) == [
+        Axis("x", unit="nanometer"),
+        Axis("y", unit="nanometer"),
+    ]
+    assert Axis("y", unit="nanometer") in coord_space
+    assert Axis("y") not in coord_space
 
 
 def test_coordiante_space_from_axis_names():
@@ -47,6 +57,18 @@ def test_coordiante_space_from_axis_names():
     assert coord_space[1] == Axis("beta", unit=None)
 
 
+def test_coordinate_space_attrs_round_trip():
+    coord_space = CoordinateSpace.from_axis_names(["x", "y"])
+    assert coord_space.axis_names == ("x", "y")
+    assert attrs.asdict(coord_space, recurse=False) == {"axes": coord_space.axes}
+    assert CoordinateSpace(**attrs.asdict(coord_space, recurse=False)) == coord_space
+    evolved = attrs.evolve(coord_space, axes=(Axis("z"),))  # type: ignore[arg-type]
+    assert evolved.axis_names == ("z",)
+    unpickled = pickle.loads(pickle.dumps(coord_space))
+    assert unpickled == coord_space
+    assert unpickled.axis_names == ("x", "y")
+
+
 @pytest.mark.parametrize(
     ("input", "expected"),
     [
@@ -89,6 +111,13 @@ def test_affine_matrix_value_error(input_matrix):
         AffineTransform(("x1", "y1"), ("x2", "y2"), input_matrix)
 
 
+def test_affine_copies_input_matrix():
+    matrix = np.array([[2, 0, 1], [0, 3, 1], [0, 0, 1]], np.float64)
+    transform = AffineTransform(("x1", "y1"), ("x2", "y2"), matrix)
+    matrix[0, 0] = 5
+    assert transform.augmented_matrix[0, 0] == 2
+
+
 def test_bad_number_of_scale_factors():
     with pytest.raises(ValueError):
         ScaleTransform(("x1", "y1"), ("x2", "y2"), [1, 2, 3])
@@ -133,6 +162,30 @@ def test_bad_number_of_scale_factors():
                 [[0.5, 0, 2.5], [0, 0.25, -1.25]],
             ),
         ),
+        (
+            AffineTransform(
+                ["x1", "y1"],
+                ["x2", "y2"],
+                [[1, 1, -1], [0, 1, 2]],
+            ),
+            AffineTransform(
+                ["x2", "y2"],
+                ["x1", "y1"],
+                [[1, -1, 3], [0, 1, -2]],
+            ),
+        ),
+        (
+            AffineTransform(
+                ["x1", "y1", "z1"],
+                ["x2", "y2", "z2"],
+                [[2, 0, 0, 1], [0, 1, 1, 0], [0, 0, 4, -4]],
+            ),
+            AffineTransform(
+                ["x2", "y2", "z2"],
+                ["x1", "y1", "z1"],
+                [[0.5, 0, 0, -0.5], [0, 1, -0.25, -1], [0, 0, 0.25, 1]],
+            ),
+        ),
         (
             ScaleTransform(["x1", "y1"], ["x2", "y2"], [4, 0.1]),
             ScaleTransform(["x2", "y2"], ["x1", "y1"], [0.25, 10]),
@@ -157,6 +210,16 @@ def test_inverse_transform(input, expected):
     np.testing.assert_allclose(result_matrix, expected_matrix)
 
 
+@pytest.mark.parametrize(
+    "matrix", [[[1, 2], [2, 4]], [[1, 2, 0], [2, 4, 0], [0, 0, 1]]]
+)
+def test_inverse_transform_singular(matrix):
+    rank = len(matrix)
+    transform = AffineTransform(["x", "y", "z"][:rank], ["a", "b", "c"][:rank], matrix)
+    with pytest.raises(np.linalg.LinAlgError):
+        transform.inverse_transform()
+
+
 def test_uniform_scale_factor():
     UniformScaleTransform(["x1", "y1"], ["x2", "y2"], 1.5)
     UniformScaleTransform(["x1", "y1"], ["x3", "y3"], 1.5)
@@ -323,3 +386,18 @@ def test_multiply_tranform(
 ):
     result = transform_a @ transform_b
     check_transform_is_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        AffineTransform(["x1", "y1"], ["x2", "y2"], [[2, 2], [0, 3]]),
+        ScaleTransform(["x1", "y1"], ["x2", "y2"], [1.5, 3.0]),
+        UniformScaleTransform(["x1", "y1"], ["x2", "y2"], 1.5),
+        IdentityTransform(["x1", "y1"], ["x2", "y2"]),
+    ],
+    ids=lambda val: type(val).__name__,
+)
+def test_transform_is_slotted(transform):
+    assert not hasattr(transform, "__dict__")
+    check_transform_is_equal(pickle.loads(pickle.dumps(transform)), transform)
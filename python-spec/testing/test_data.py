@@ -0,0 +1,109 @@
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from somacore import RecordBatchReadIter
+from somacore import data
+
+_SCHEMA = pa.schema([("soma_joinid", pa.int64()), ("value", pa.float32())])
+
+
+def _reader(*lengths: int) -> pa.RecordBatchReader:
+    batches = []
+    start = 0
+    for length in lengths:
+        joinids = list(range(start, start + length))
+        batches.append(
+            pa.RecordBatch.from_pydict(
+                {"soma_joinid": joinids, "value": [float(i) for i in joinids]},
+                schema=_SCHEMA,
+            )
+        )
+        start += length
+    return pa.RecordBatchReader.from_batches(_SCHEMA, batches)
+
+
+def test_record_batch_read_iter():
+    batches = list(RecordBatchReadIter(_reader(2, 3)))
+    assert [batch.num_rows for batch in batches] == [2, 3]
+    assert batches[1].column("soma_joinid").to_pylist() == [2, 3, 4]
+
+
+def test_record_batch_read_iter_concat():
+    read_iter = RecordBatchReadIter(_reader(2, 3, 1))
+    first = next(read_iter)
+    assert first.num_rows == 2
+    rest = read_iter.concat()
+    assert isinstance(rest, pa.RecordBatch)
+    assert rest.column("soma_joinid").to_pylist() == [2, 3, 4, 5]
+
+
+def test_record_batch_read_iter_concat_empty():
+    rest = RecordBatchReadIter(_reader()).concat()
+    assert rest.schema == _SCHEMA
+    assert rest.num_rows == 0
+
+
+def _unsupported(*args: Any, **kwargs: Any) -> Any:
+    raise NotImplementedError()
+
+
+class _DataFrame(data.DataFrame):
+    """A DataFrame whose reads stream from a fixed record batch reader."""
+
+    __slots__ = ("_reader",)
+
+    def __init__(self, reader: Any) -> None:
+        self._reader = reader
+
+    def read_batches(self, *args: Any, **kwargs: Any) -> RecordBatchReadIter:
+        return RecordBatchReadIter(self._reader)
+
+    # The rest of the DataFrame interface is not used by these tests.
+    create = open = exists = classmethod(_unsupported)
+    read = write = change_domain = _unsupported
+    uri = metadata = mode = closed = None  # type: ignore[assignment]
+    domain = schema = index_column_names = None  # type: ignore[assignment]
+
+
+class _UncombinableReader:
+    """Stands in for a stream whose columns are too large to merge.
+
+    Arrow leaves such columns (e.g., over 2 GiB of strings) in several chunks
+    even after ``combine_chunks``.
+    """
+
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+
+    def read_all(self) -> "_UncombinableReader":
+        return self
+
+    def combine_chunks(self) -> pa.Table:
+        return self._table
+
+
+def test_record_batch_read_iter_concat_uncombinable():
+    table = _reader(1, 1).read_all()
+    assert len(table.to_batches()) == 2
+    read_iter = RecordBatchReadIter(_UncombinableReader(table))
+    with pytest.raises(ValueError, match="too large"):
+        read_iter.concat()
+
+
+def test_read_columns():
+    read_iter = _DataFrame(_reader(2, 3, 1)).read_columns()
+    first = next(read_iter)
+    assert list(first) == ["soma_joinid", "value"]
+    assert isinstance(first["value"], pa.Array)
+    assert first["value"].to_pylist() == [0.0, 1.0]
+    rest = read_iter.concat()
+    assert rest["soma_joinid"].to_pylist() == [2, 3, 4, 5]
+
+
+def test_read_columns_concat_uncombinable():
+    table = _reader(1, 1).read_all()
+    read_iter = _DataFrame(_UncombinableReader(table)).read_columns()
+    with pytest.raises(ValueError, match="too large"):
+        read_iter.concat()
@@ -0,0 +1,80 @@
+from typing import Any, Dict, Iterator, MutableMapping
+
+import pytest
+
+import somacore
+from somacore import _mixin
+
+
+class _Mapping(MutableMapping[str, Any]):
+    def __init__(self, **entries: Any) -> None:
+        self._entries: Dict[str, Any] = dict(entries)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._entries[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _FirstSecond(_Mapping):
+    first = _mixin.item(str)
+    second = _mixin.item(int, "2nd")
+
+
+def test_item_descriptor():
+    assert isinstance(_FirstSecond.first, _mixin.item)
+    assert _FirstSecond.first.field_name == "first"
+    assert _FirstSecond.first.item_name == "first"
+    assert _FirstSecond.second.field_name == "second"
+    assert _FirstSecond.second.item_name == "2nd"
+
+
+def test_item_access():
+    inst = _FirstSecond(first="one")
+    assert inst.first == "one"
+    inst.second = 2
+    assert inst["2nd"] == 2
+    assert inst.second == 2
+    del inst.second
+    assert "2nd" not in inst
+
+
+def test_item_empty_mapping():
+    # An empty (falsy) mapping is still an instance, not a class access.
+    inst = _FirstSecond()
+    with pytest.raises(AttributeError, match="'_FirstSecond' object has no attribute"):
+        inst.first
+    with pytest.raises(AttributeError):
+        del inst.second
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        name
+        for name in somacore.__all__
+        if isinstance(getattr(somacore, name), type)
+        and issubclass(getattr(somacore, name), somacore.SOMAObject)
+    ],
+)
+def test_soma_types_are_slotted(name):
+    # Every class in the MRO must declare __slots__ so that implementations
+    # (and their item-based mixins) can avoid a per-instance __dict__.
+    cls = getattr(somacore, name)
+    assert not cls.__dictoffset__, [
+        base.__name__ for base in cls.__mro__ if "__slots__" not in vars(base)
+    ]
+
+
+def test_item_is_slotted():
+    assert not hasattr(_mixin.item(), "__dict__")
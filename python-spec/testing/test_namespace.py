@@ -0,0 +1,81 @@
+import ast
+import importlib
+import os
+import pathlib
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+import somacore
+
+
+@pytest.mark.parametrize("name", somacore.__all__)
+def test_exported_name(name):
+    value = getattr(somacore, name)
+    assert value is getattr(somacore, name)
+    assert name in dir(somacore)
+
+
+@pytest.mark.parametrize("name", ["data", "options", "query", "types"])
+def test_submodule(name):
+    assert getattr(somacore, name) is importlib.import_module(f"somacore.{name}")
+
+
+def test_missing_name():
+    with pytest.raises(AttributeError):
+        somacore.NotASOMAType  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    ("value", "eager"),
+    [("1", True), ("true", True), ("TRUE", True), ("0", False), ("", False)],
+)
+def test_eager_import(value, eager):
+    code = f"import sys, somacore; assert ('somacore.query' in sys.modules) is {eager}"
+    env = dict(os.environ, SOMA_EAGER_IMPORT=value)
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def _type_checking_imports() -> Set[str]:
+    """Returns the names imported under ``if TYPE_CHECKING:`` in somacore."""
+    tree = ast.parse(pathlib.Path(somacore.__file__).read_text())
+    names: Set[str] = set()
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            for stmt in node.body:
+                assert isinstance(stmt, ast.ImportFrom)
+                names.update(alias.asname or alias.name for alias in stmt.names)
+    return names
+
+
+def test_lazy_table_matches_all():
+    # The TYPE_CHECKING imports, _LAZY, and __all__ must all list the same names.
+    assert set(somacore.__all__) == somacore._LAZY.keys()
+    assert _type_checking_imports() == somacore._LAZY.keys()
+
+
+def test_type_checker_rejects_missing_name():
+    # The lazy __getattr__ is hidden from type checkers, so they still report
+    # names that somacore does not export rather than treating them as Any.
+    mypy_api = pytest.importorskip("mypy.api")
+    stdout, _, status = mypy_api.run(
+        ["--no-incremental", "-c", "import somacore\nsomacore.NotASOMAType\n"]
+    )
+    assert status == 1
+    assert 'has no attribute "NotASOMAType"' in stdout
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, somacore\n"
+        "loaded = {'somacore.data', 'somacore.query', 'somacore.spatial'}\n"
+        "assert not loaded & sys.modules.keys(), loaded & sys.modules.keys()\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "SOMA_EAGER_IMPORT"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
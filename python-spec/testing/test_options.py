@@ -0,0 +1,72 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from somacore import BatchSize
+from somacore import IOfN
+
+
+@pytest.mark.parametrize(
+    ("kwargs",),
+    [({},), ({"count": 100},), ({"bytes": 1024**2},), ({"count": 0, "bytes": 10},)],
+)
+def test_batch_size(kwargs):
+    batch_size = BatchSize(**kwargs)
+    assert batch_size.count == kwargs.get("count")
+    assert batch_size.bytes == kwargs.get("bytes")
+    assert batch_size == BatchSize(**kwargs)
+    assert hash(batch_size) == hash(BatchSize(**kwargs))
+    assert pickle.loads(pickle.dumps(batch_size)) == batch_size
+
+
+@pytest.mark.parametrize(
+    ("kwargs",), [({"count": -1},), ({"bytes": -1},), ({"count": 1, "bytes": 1},)]
+)
+def test_batch_size_value_error(kwargs):
+    with pytest.raises(ValueError):
+        BatchSize(**kwargs)
+
+
+def test_i_of_n():
+    partition = IOfN(1, 3)
+    assert (partition.i, partition.n) == (1, 3)
+    assert partition == IOfN(i=1, n=3)
+    assert partition != IOfN(2, 3)
+    assert repr(partition) == "IOfN(i=1, n=3)"
+    assert pickle.loads(pickle.dumps(partition)) == partition
+
+
+class _Partition(IOfN):
+    __slots__ = ()
+
+
+class _BatchSize(BatchSize):
+    __slots__ = ()
+
+
+def test_slotted_subclass():
+    partition = _Partition(0, 2)
+    assert partition == _Partition(0, 2)
+    assert partition != _Partition(1, 3)
+    assert partition != IOfN(0, 2)
+    assert hash(partition) != hash(_Partition(1, 3))
+    assert repr(partition) == "_Partition(i=0, n=2)"
+    assert pickle.loads(pickle.dumps(partition)) == partition
+    batch_size = _BatchSize(count=10)
+    assert batch_size != _BatchSize(bytes=10)
+    assert repr(batch_size) == "_BatchSize(count=10, bytes=None)"
+    assert pickle.loads(pickle.dumps(batch_size)) == batch_size
+
+
+@pytest.mark.parametrize(("i", "n"), [(-1, 3), (3, 3), (0, 0)])
+def test_i_of_n_value_error(i, n):
+    with pytest.raises(ValueError):
+        IOfN(i, n)
+
+
+def test_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        BatchSize().count = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del IOfN(0, 1).i